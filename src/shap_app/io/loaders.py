@@ -1,5 +1,12 @@
 """ Dataset Loaders for the SHAP App. """
+from typing import Any
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from pandas._libs.parsers import STR_NA_VALUES
 
 from shap_app.datasets.boston_housing.loader import load_boston_housing_data
 from shap_app.datasets.california_housing.loader import load_california_housing_data
@@ -34,3 +41,186 @@ def load_full_dataset(dataset_name: str = "boston_housing") -> pd.DataFrame:
     elif dataset_name == "california_housing":
         return load_california_housing_data()
     raise ValueError(f"Unknown dataset: {dataset_name}")
+
+
+def read_csv(
+    csv_path: str,
+    dtype: dict[str, Any] | None = None,
+    usecols: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read a CSV file into a pandas' DataFrame using PyArrow.
+
+    The file is parsed with PyArrow's multithreaded CSV reader and converted
+    to pandas with one block per column, so numeric columns are handed over
+    without consolidating them into a single copied 2-D block. The Arrow
+    table is released column by column during the conversion, which keeps
+    peak memory close to the size of the resulting DataFrame.
+
+    Declaring NumPy column types skips type inference for those columns, and
+    restricting the columns means the remaining ones are never converted.
+    Other dtypes, such as "category", "string" or `pd.Int64Dtype()`, have no
+    NumPy equivalent and are applied after the file has been read.
+
+    Cells are parsed as `pd.read_csv` would: the strings pandas reads as
+    missing (e.g. "NA", "n/a" or an empty cell) are null in every column,
+    and date-like columns are kept as text rather than converted to dates.
+
+    Parameters
+    ----------
+    csv_path : str
+        The path to the CSV file to read.
+    dtype : dict[str, Any] | None, optional
+        A mapping of column names to dtypes (e.g. "float32" or "category") to
+        use instead of the inferred types, accepting the dtypes pandas does.
+        Default is None.
+    usecols : list[str] | None, optional
+        The columns to read. All columns are read if not provided.
+        Default is None.
+
+    Returns
+    -------
+    pd.DataFrame
+        The contents of the CSV file in the form of a pandas' DataFrame.
+    """
+    arrow_types, pandas_types = _split_dtypes(dtype)
+    table = _read_csv_table(csv_path, arrow_types, usecols)
+    # PyArrow infers dates and timestamps, which pandas leaves as text, so
+    # those columns are read again as strings
+    temporal = {
+        field.name: pa.string()
+        for field in table.schema
+        if pa.types.is_temporal(field.type) and field.name not in arrow_types
+    }
+    if temporal:
+        table = _read_csv_table(csv_path, arrow_types | temporal, usecols)
+    return _astype(table.to_pandas(split_blocks=True, self_destruct=True), pandas_types)
+
+
+def _read_csv_table(
+    csv_path: str,
+    column_types: dict[str, pa.DataType],
+    usecols: list[str] | None,
+) -> pa.Table:
+    """
+    Read a CSV file into an Arrow table, treating pandas' NA strings as null.
+
+    Parameters
+    ----------
+    csv_path : str
+        The path to the CSV file to read.
+    column_types : dict[str, pa.DataType]
+        The Arrow types of the columns that are not inferred.
+    usecols : list[str] | None
+        The columns to read. All columns are read if not provided.
+
+    Returns
+    -------
+    pa.Table
+        The contents of the CSV file in the form of an Arrow table.
+    """
+    convert_options = pacsv.ConvertOptions(
+        column_types=column_types,
+        null_values=sorted(STR_NA_VALUES),
+        strings_can_be_null=True,
+        include_columns=usecols or [],
+    )
+    return pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=convert_options,
+    )
+
+
+def read_parquet(
+    parquet_path: str,
+    dtype: dict[str, Any] | None = None,
+    usecols: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read a Parquet file into a pandas' DataFrame using PyArrow.
+
+    Parquet files store typed columns, so no text is parsed and no types are
+    inferred, and only the requested columns are read from disk. The table is
+    converted to pandas the same way as in `read_csv`.
+
+    Parameters
+    ----------
+    parquet_path : str
+        The path to the Parquet file to read.
+    dtype : dict[str, Any] | None, optional
+        A mapping of column names to dtypes (e.g. "float32" or "category") to
+        cast the stored columns to, accepting the dtypes pandas does.
+        Default is None.
+    usecols : list[str] | None, optional
+        The columns to read. All columns are read if not provided.
+        Default is None.
+
+    Returns
+    -------
+    pd.DataFrame
+        The contents of the Parquet file in the form of a pandas' DataFrame.
+    """
+    arrow_types, pandas_types = _split_dtypes(dtype)
+    table = pq.read_table(parquet_path, columns=usecols)
+    if arrow_types:
+        table = table.cast(
+            pa.schema(
+                [
+                    field.with_type(arrow_types[field.name]) if field.name in arrow_types else field
+                    for field in table.schema
+                ]
+            )
+        )
+    return _astype(table.to_pandas(split_blocks=True, self_destruct=True), pandas_types)
+
+
+def _split_dtypes(
+    dtype: dict[str, Any] | None,
+) -> tuple[dict[str, pa.DataType], dict[str, Any]]:
+    """
+    Split column dtypes into the ones PyArrow can read and the rest.
+
+    Parameters
+    ----------
+    dtype : dict[str, Any] | None
+        A mapping of column names to dtypes.
+
+    Returns
+    -------
+    tuple[dict[str, pa.DataType], dict[str, Any]]
+        The Arrow types of the columns with a NumPy dtype, and the dtypes of
+        the other columns, such as pandas extension dtypes, to apply with
+        `pd.DataFrame.astype`.
+    """
+    arrow_types: dict[str, pa.DataType] = {}
+    pandas_types: dict[str, Any] = {}
+    for column, kind in (dtype or {}).items():
+        try:
+            arrow_types[column] = pa.from_numpy_dtype(np.dtype(kind))
+        except (TypeError, NotImplementedError):
+            pandas_types[column] = kind
+    return arrow_types, pandas_types
+
+
+def _astype(frame: pd.DataFrame, pandas_types: dict[str, Any]) -> pd.DataFrame:
+    """
+    Cast the columns of a DataFrame that were read to the given dtypes.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The DataFrame read from a file.
+    pandas_types : dict[str, Any]
+        A mapping of column names to dtypes. Columns that were not read are
+        ignored.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with the columns cast to their dtypes.
+    """
+    pandas_types = {
+        column: kind for column, kind in pandas_types.items() if column in frame.columns
+    }
+    return frame.astype(pandas_types) if pandas_types else frame
@@ -0,0 +1,102 @@
+""" Typed wrappers around Streamlit's cache decorators. """
+from collections.abc import Callable
+from typing import ParamSpec
+from typing import TypeVar
+from typing import cast
+from typing import overload
+
+from streamlit import cache_data
+from streamlit import cache_resource
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@overload
+def st_typed_cache_resource(func: Callable[P, R]) -> Callable[P, R]:
+    ...
+
+
+@overload
+def st_typed_cache_resource(
+    *, max_entries: int | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    ...
+
+
+def st_typed_cache_resource(
+    func: Callable[P, R] | None = None, *, max_entries: int | None = None
+) -> Callable[P, R] | Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    This is a decorator for Streamlit cache resource. It is used to cache the
+    output of a function that is computationally expensive to recreate each
+    time the script is run. The function must be a typed function.
+
+    Implemented to make MyPy happy: the decorated function keeps its
+    parameter and return types.
+
+    Parameters
+    ----------
+    func : Callable[P, R], optional
+        The function whose output needs to be cached. If not given, a
+        decorator taking the function is returned, so the decorator can be
+        used with arguments.
+    max_entries : int, optional
+        The maximum number of entries to keep in the cache, dropping the
+        oldest ones first. The default is None, which keeps every entry.
+
+    Returns
+    -------
+    Callable[P, R] or Callable[[Callable[P, R]], Callable[P, R]]
+        The same function with caching enabled, or a decorator returning it.
+    """
+
+    def decorate(function: Callable[P, R]) -> Callable[P, R]:
+        return cast(Callable[P, R], cache_resource(max_entries=max_entries)(function))
+
+    return decorate if func is None else decorate(func)
+
+
+@overload
+def st_typed_cache_data(func: Callable[P, R]) -> Callable[P, R]:
+    ...
+
+
+@overload
+def st_typed_cache_data(
+    *, max_entries: int | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    ...
+
+
+def st_typed_cache_data(
+    func: Callable[P, R] | None = None, *, max_entries: int | None = None
+) -> Callable[P, R] | Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    This is a decorator for Streamlit cache data. It is used to cache the
+    output of a function that is computationally expensive to recreate each
+    time the script is run. The function must be a typed function.
+
+    Implemented to make MyPy happy: the decorated function keeps its
+    parameter and return types.
+
+    Parameters
+    ----------
+    func : Callable[P, R], optional
+        The function whose output needs to be cached. If not given, a
+        decorator taking the function is returned, so the decorator can be
+        used with arguments.
+    max_entries : int, optional
+        The maximum number of entries to keep in the cache, dropping the
+        oldest ones first. The default is None, which keeps every entry.
+
+    Returns
+    -------
+    Callable[P, R] or Callable[[Callable[P, R]], Callable[P, R]]
+        The same function with caching enabled, or a decorator returning it.
+    """
+
+    def decorate(function: Callable[P, R]) -> Callable[P, R]:
+        return cast(Callable[P, R], cache_data(max_entries=max_entries)(function))
+
+    return decorate if func is None else decorate(func)
@@ -1,10 +1,17 @@
 """ Helper functions for charts in the webapp. """
 from __future__ import annotations
 
+import os
+import tempfile
 from collections.abc import Callable
 from typing import Any
 
 import pandas as pd
+from matplotlib.figure import Figure
+
+# The process umask, read once at import since it can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
 def rerun_on_attribute_error(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
@@ -72,3 +79,37 @@ def get_num_rows_for_figures(dataset: pd.DataFrame, figs_per_row: int = 7) -> in
         n_rows += 1
 
     return n_rows
+
+
+def save_figure(fig: Figure, image_file: str) -> None:
+    """
+    Save a figure to an image file atomically.
+
+    The figure is written to a temporary file in the same directory, which
+    then replaces `image_file`. Concurrent sessions saving the same plot
+    never leave a partially written image for others to load. The file gets
+    the permissions of a plainly created file, rather than the owner-only
+    permissions of the temporary file.
+
+    Parameters
+    ----------
+    fig : Figure
+        The matplotlib figure to save.
+    image_file : str
+        The path of the image file, whose extension sets the image format.
+
+    Returns
+    -------
+    None
+    """
+    directory, file_name = os.path.split(image_file)
+    root, extension = os.path.splitext(file_name)
+    fd, tmp_file = tempfile.mkstemp(suffix=extension, prefix=f".{root}.", dir=directory or None)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            fig.savefig(file, format=extension.lstrip(".") or None)
+        os.chmod(tmp_file, 0o666 & ~_UMASK)
+        os.replace(tmp_file, image_file)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
@@ -1,36 +1,7 @@
 """ Components for displaying dataset information. """
-from collections.abc import Callable
-from typing import Any
-from typing import TypeVar
-from typing import cast
-
 import pandas as pd
 
-F = TypeVar("F", bound=Callable[..., Any])
-
-
-def st_typed_cache_data(func: F) -> F:
-    """
-    Streamlit cache data decorator for typed functions.
-
-    This decorator is used to cache the results of a function call in
-    Streamlit. It is specifically designed for functions with typed arguments,
-    ensuring that the cache is correctly invalidated when the types of the
-    arguments change.
-
-    Parameters
-    ----------
-    func : Callable[..., Any]
-        The function whose results should be cached.
-
-    Returns
-    -------
-    Callable[..., Any]
-        The decorated function, which will have its results cached.
-    """
-    from streamlit import cache_data
-
-    return cast(F, cache_data(func))
+from shap_app.webapp.cache_helpers import st_typed_cache_data
 
 
 @st_typed_cache_data
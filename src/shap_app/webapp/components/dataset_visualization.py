@@ -1,20 +1,45 @@
-from copy import deepcopy
-
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
 import streamlit as st
 
+from shap_app.webapp.cache_helpers import st_typed_cache_data
 from shap_app.webapp.components.eda_boxplots import box_plots_section
 from shap_app.webapp.components.eda_histograms import histograms_and_kde_plots
 from shap_app.webapp.components.outliers import introduction_to_techniques_to_remove_outliers
 from shap_app.webapp.components.outliers import remove_outliers_percentile
 from shap_app.webapp.components.outliers import remove_outliers_robust_z_score
+from shap_app.webapp.components.outliers import validate_column
 
 plt.style.use("ggplot")
 sns.set_theme(style="whitegrid")
 
+_VISUALIZATION_INTRO_MD = """
+Here we delve into the exploratory phase of our data analysis. This
+crucial step involves a deep dive into the dataset, where we uncover
+patterns, spot anomalies, test hypotheses, and check assumptions with
+the help of summary statistics and graphical representations.
+Visualization is a powerful tool that aids in understanding complex data
+sets. By creating charts, graphs, and other visual depictions of data,
+we can more easily identify trends, correlations, and outliers that
+might not be apparent from looking at raw data alone. This process not
+only provides valuable insights that can guide the subsequent modeling
+but also helps us validate the appropriateness of our data for the
+chosen model. This stage is about transforming our data from a raw form
+into knowledge and insights, setting the stage for further analysis and
+predictive modeling.
+
+## Univariate Analysis
+
+We start by visualizing each feature in the dataset. This helps us
+understand the distribution of each feature and identify any outliers
+or anomalies. We can also use this information to determine whether
+we need to transform the data to make it more suitable for modeling.
+
+### Box Plots
+"""
+
 
 def visualize_data_introduction(dataset: pd.DataFrame) -> None:
     """
@@ -33,33 +58,7 @@ def visualize_data_introduction(dataset: pd.DataFrame) -> None:
         This function does not return any value. It displays an introductory
         text about data visualization.
     """
-    st.markdown(
-        "Here we delve into the exploratory phase of our data analysis. "
-        "This crucial step involves a deep dive into the dataset, where we uncover "
-        "patterns, spot anomalies, test hypotheses, and check assumptions with the "
-        "help of summary statistics and graphical representations. Visualization "
-        "is a powerful tool that aids in understanding complex data sets. By "
-        "creating charts, graphs, and other visual depictions of data, we can more "
-        "easily identify trends, correlations, and outliers that might not be "
-        "apparent from looking at raw data alone. This process not only provides "
-        "valuable insights that can guide the subsequent modeling but also helps "
-        "us validate the appropriateness of our data for the chosen model. This "
-        "stage is about transforming our data from a raw form into knowledge and "
-        "insights, setting the stage for further analysis and predictive modeling."
-    )
-
-    st.markdown(
-        """
-        ## Univariate Analysis
-
-        We start by visualizing each feature in the dataset. This helps us
-        understand the distribution of each feature and identify any outliers
-        or anomalies. We can also use this information to determine whether
-        we need to transform the data to make it more suitable for modeling.
-
-        ### Box Plots
-        """
-    )
+    st.markdown(_VISUALIZATION_INTRO_MD)
 
     box_plots_section(st.session_state["df"])
 
@@ -79,7 +78,9 @@ def remove_target_outliers() -> None:
     """
     Remove outliers in the target column.
     """
-    threshold = remove_outliers_percentile(st.session_state["df"], "TARGET", 0.05, "upper")
+    # Extract the target once and share it between both outlier methods
+    target = validate_column(st.session_state["df"], "TARGET")
+    threshold, mask = _target_outlier_mask(target)
     st.markdown(
         f"""
             #### Remove Target Outliers
@@ -91,9 +92,33 @@ def remove_target_outliers() -> None:
             distribution of the rest of the data.
             """
     )
-    mask = remove_outliers_robust_z_score(st.session_state["df"], "TARGET", threshold, "upper")
-    df = deepcopy(st.session_state["df"])
-    st.session_state["df_masked"] = df[mask]
+    # Boolean indexing already returns a new frame, so the source is not copied first
+    st.session_state["df_masked"] = st.session_state["df"][mask]
+
+
+@st_typed_cache_data
+def _target_outlier_mask(target: np.ndarray) -> tuple[float, np.ndarray]:
+    """
+    Compute the upper outlier mask of the target column and cache it.
+
+    Only the target column is hashed, rather than the whole dataset, so the
+    lookup stays cheap while the percentile and robust Z-score passes are
+    skipped on reruns.
+
+    Parameters
+    ----------
+    target : np.ndarray
+        The target column.
+
+    Returns
+    -------
+    tuple[float, np.ndarray]
+        The robust Z-score threshold that removes about 5% of the data, and
+        the mask of the data points below it.
+    """
+    threshold = float(remove_outliers_percentile(target, None, 0.05, "upper"))
+    mask = remove_outliers_robust_z_score(target, None, threshold, "upper")
+    return threshold, mask
 
 
 def raw_dataset_insights(dataset: pd.DataFrame) -> None:
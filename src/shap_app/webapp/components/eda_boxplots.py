@@ -7,6 +7,7 @@ import streamlit as st
 from matplotlib import pyplot as plt
 
 from shap_app.webapp.chart_helpers import get_num_rows_for_figures
+from shap_app.webapp.chart_helpers import save_figure
 
 
 def box_plots_section(dataset: pd.DataFrame) -> None:
@@ -113,12 +114,16 @@ def calculate_outliers_using_iqr(dataset: pd.DataFrame) -> pd.Series:
         A Pandas' Series containing the number of outliers in each column of
         the dataset.
     """
-    return dataset.apply(
-        lambda x: (
-            (x < (x.quantile(0.25) - 1.5 * (x.quantile(0.75) - x.quantile(0.25))))
-            | (x > (x.quantile(0.75) + 1.5 * (x.quantile(0.75) - x.quantile(0.25))))
-        ).sum()
-    )
+    # All columns are handled at once on the 2-D array. Missing values are
+    # skipped by the quartiles and never counted, as with Series.quantile.
+    # This stays in NumPy rather than a numba prange kernel: numba's default
+    # workqueue threading layer aborts when parallel kernels are launched
+    # from concurrent threads, which is how Streamlit runs sessions.
+    values = dataset.to_numpy(dtype=np.float64)
+    q1, q3 = np.nanpercentile(values, [25, 75], axis=0)
+    iqr = q3 - q1
+    outliers = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+    return pd.Series(outliers.sum(axis=0), index=dataset.columns)
 
 
 def create_visualization_box_plots(dataset: pd.DataFrame, fig_name: str = "box_plots") -> None:
@@ -156,7 +161,7 @@ def create_visualization_box_plots(dataset: pd.DataFrame, fig_name: str = "box_p
         plt.tight_layout(pad=0.4, w_pad=0.5, h_pad=5.0)
 
         box_plot = plt.gcf()
-        box_plot.savefig(image_file)
+        save_figure(box_plot, image_file)
         st.pyplot(box_plot, clear_figure=True)
 
         st.markdown(
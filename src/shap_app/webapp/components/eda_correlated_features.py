@@ -9,6 +9,7 @@ from matplotlib import pyplot as plt
 from sklearn import preprocessing
 
 from shap_app.webapp.chart_helpers import get_num_rows_for_figures
+from shap_app.webapp.chart_helpers import save_figure
 
 plt.style.use("ggplot")
 sns.set_theme(style="whitegrid")
@@ -144,7 +145,7 @@ def plot_scaled_reg_plots(
             )
         plt.tight_layout(pad=0.4, w_pad=1.0, h_pad=2.5)
         reg_plots = plt.gcf()
-        reg_plots.savefig(image_file)
+        save_figure(reg_plots, image_file)
         st.pyplot(reg_plots, clear_figure=True)
 
 
@@ -232,7 +233,7 @@ def plot_pairplot(
         )
         # plt.tight_layout()
         pairplot = plt.gcf()
-        pairplot.savefig(image_file)
+        save_figure(pairplot, image_file)
         st.pyplot(pairplot, clear_figure=True)
 
 
@@ -6,6 +6,7 @@ import streamlit as st
 from matplotlib import pyplot as plt
 
 from shap_app.webapp.chart_helpers import get_num_rows_for_figures
+from shap_app.webapp.chart_helpers import save_figure
 
 
 def histograms_and_kde_plots(dataset: pd.DataFrame) -> None:
@@ -86,7 +87,7 @@ def create_visualization_histogram_plots(
         plt.tight_layout(pad=0.4, w_pad=0.5, h_pad=5.0)
 
         histogram_plot = plt.gcf()
-        histogram_plot.savefig(image_file)
+        save_figure(histogram_plot, image_file)
         st.pyplot(histogram_plot, clear_figure=True)
 
         st.markdown(
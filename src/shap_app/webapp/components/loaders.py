@@ -1,62 +1,18 @@
 """ This module contains functions for loading the model and data. """
 import os
-import pickle
-from collections.abc import Callable
 from typing import Any
-from typing import TypeVar
-from typing import cast
 
+import joblib
 import pandas as pd
 
 from shap_app.io.loaders import load_full_dataset
+from shap_app.io.loaders import read_csv
+from shap_app.io.loaders import read_parquet
+from shap_app.webapp.cache_helpers import st_typed_cache_data
+from shap_app.webapp.cache_helpers import st_typed_cache_resource
 
-F = TypeVar("F", bound=Callable[..., Any])
-
-
-def st_typed_cache_resource(func: F) -> F:
-    """
-    This is a decorator for Streamlit cache resource. It is used to cache the
-    output of a function that is computationally expensive to recreate each
-    time the script is run. The function must be a typed function.
-
-    Implemented to make MyPy happy.
-
-    Parameters
-    ----------
-    func : Callable[..., Any]
-        The function whose output needs to be cached.
-
-    Returns
-    -------
-    Callable[..., Any]
-        The same function with caching enabled.
-    """
-    from streamlit import cache_resource
-
-    return cast(F, cache_resource(func))
-
-
-def st_typed_cache_data(func: F) -> F:
-    """
-    This is a decorator for Streamlit cache data. It is used to cache the
-    output of a function that is computationally expensive to recreate each
-    time the script is run. The function must be a typed function.
-
-    Implemented to make MyPy happy.
-
-    Parameters
-    ----------
-    func : Callable[..., Any]
-        The function whose output needs to be cached.
-
-    Returns
-    -------
-    Callable[..., Any]
-        The same function with caching enabled.
-    """
-    from streamlit import cache_data
-
-    return cast(F, cache_data(func))
+# Dataset names that `load_data` loads with `load_full_dataset`
+_KNOWN_DATASETS = frozenset({"boston_housing", "california_housing"})
 
 
 @st_typed_cache_resource
@@ -64,10 +20,11 @@ def load_model(model_path: str) -> object:
     """
     Load a model from a pickle file.
 
-    This function uses the Python pickle module to deserialize a model object
-    from a file. The file is expected to be a pickle file, which is a binary
-    file format used by Python for serializing and deserializing Python object
-    structures.
+    This function uses joblib to deserialize a model object from a file. The
+    file is expected to be a pickle file, either written by the Python pickle
+    module or by `joblib.dump`. For joblib dumps, NumPy arrays inside the
+    model are memory-mapped read-only from disk instead of being copied into
+    memory, so their pages are loaded on demand and shared between processes.
 
     The function is decorated with the `st_typed_cache_resource` decorator,
     which caches the output of the function in Streamlit. This is useful for
@@ -91,27 +48,91 @@ def load_model(model_path: str) -> object:
         pickled, but in the context of this function it is expected to be a
         machine learning model object of some kind.
     """
-    return pickle.load(open(model_path, "rb"))
+    return joblib.load(model_path, mmap_mode="r")
 
 
-@st_typed_cache_data
-def load_data(dataset: str = "boston_housing") -> pd.DataFrame:
+def load_data(
+    dataset: str = "boston_housing",
+    dtype: dict[str, Any] | None = None,
+    usecols: list[str] | None = None,
+) -> pd.DataFrame:
     """
     Load a dataset using the shap library. By default, the Boston Housing
-    dataset is loaded. This function can also load a dataset from a CSV file
-    if a valid file path is provided instead of a dataset name.
+    dataset is loaded. This function can also load a dataset from a CSV or
+    Parquet file if a valid file path is provided instead of a dataset name.
+    Files ending in ".parquet" are read as Parquet and any other file as CSV.
 
-    This function is decorated with the `st_typed_cache_data` decorator, which
-    caches the output of the function in Streamlit. This is useful for
-    computationally expensive operations, such as loading a large dataset, as
-    it allows the result to be stored and reused across multiple runs of the
-    script, rather than being recomputed each time.
+    The loaded dataset is cached in Streamlit with the `st_typed_cache_data`
+    decorator, which is useful for computationally expensive operations, such
+    as loading a large dataset, as it allows the result to be stored and
+    reused across multiple runs of the script, rather than being recomputed
+    each time. For files the cache is also keyed on the modification time and
+    size of the file, so replacing the file invalidates the cached copy.
 
     Parameters
     ----------
     dataset : str, optional
-        The name of the dataset to load or the path to a CSV file. If not
-        provided, the Boston Housing dataset is loaded by default.
+        The name of the dataset to load or the path to a CSV or Parquet file.
+        If not provided, the Boston Housing dataset is loaded by default.
+    dtype : dict[str, Any] | None, optional
+        A mapping of column names to dtypes used when reading a file, such as
+        "float32", "category" or `pd.Int64Dtype()`. NumPy dtypes skip type
+        inference for those columns of a CSV file. Ignored for dataset names.
+        Default is None.
+    usecols : list[str] | None, optional
+        The columns to read from a file. Ignored for dataset names.
+        Default is None.
+
+    Returns
+    -------
+    pd.DataFrame
+        The loaded dataset as a Panda's DataFrame.
+
+    Raises
+    ------
+    ValueError
+        If the dataset is neither a known dataset name nor an existing file.
+    """
+    file_stamp = None
+    if dataset not in _KNOWN_DATASETS:
+        # Unknown names fail here instead of as a miss of the Streamlit cache,
+        # which does not cache exceptions and would hash the arguments each time
+        if not os.path.isfile(dataset):
+            raise ValueError(f"Unknown dataset: {dataset}")
+        stat = os.stat(dataset)
+        file_stamp = (stat.st_mtime_ns, stat.st_size)
+    # pandas extension dtypes cannot be hashed by Streamlit, so the cache is
+    # keyed on their representations and the dtypes themselves are unhashed
+    dtype_key = None if dtype is None else tuple((c, repr(k)) for c, k in dtype.items())
+    return _load_data(dataset, file_stamp, dtype_key, usecols, dtype)
+
+
+@st_typed_cache_data
+def _load_data(
+    dataset: str,
+    file_stamp: tuple[int, int] | None,
+    dtype_key: tuple[tuple[str, str], ...] | None,
+    usecols: list[str] | None,
+    _dtype: dict[str, Any] | None,
+) -> pd.DataFrame:
+    """
+    Load and cache a dataset for `load_data`.
+
+    Parameters
+    ----------
+    dataset : str
+        The name of the dataset to load or the path to a CSV or Parquet file.
+    file_stamp : tuple[int, int] | None
+        The modification time in nanoseconds and the size of the file, or
+        None for dataset names. Only used as part of the cache key.
+    dtype_key : tuple[tuple[str, str], ...] | None
+        The column names and representations of the dtypes in `_dtype`. Only
+        used as part of the cache key.
+    usecols : list[str] | None
+        The columns to read from a file.
+    _dtype : dict[str, Any] | None
+        A mapping of column names to dtypes used when reading a file. Not
+        hashed by Streamlit.
 
     Returns
     -------
@@ -119,12 +140,54 @@ def load_data(dataset: str = "boston_housing") -> pd.DataFrame:
         The loaded dataset as a Panda's DataFrame.
     """
     # Check if the dataset is a file path
-    if os.path.isfile(dataset):
-        return pd.read_csv(dataset)
+    if file_stamp is not None:
+        if dataset.endswith(".parquet"):
+            return read_parquet(dataset, dtype=_dtype, usecols=usecols)
+        return read_csv(dataset, dtype=_dtype, usecols=usecols)
+
+    return load_full_dataset(dataset)
+
+
+def load_image(image_path: str) -> bytes:
+    """
+    Load an image file, such as a saved plot, as bytes.
+
+    The bytes are cached in Streamlit with the `st_typed_cache_resource`
+    decorator, so reruns pass the image to `st.image` from memory instead of
+    reading the file again. The cache is keyed on the modification time and
+    size of the file, so overwriting the image invalidates the cached copy.
+
+    Parameters
+    ----------
+    image_path : str
+        The path to the image file.
+
+    Returns
+    -------
+    bytes
+        The contents of the image file.
+    """
+    stat = os.stat(image_path)
+    return _load_image(image_path, (stat.st_mtime_ns, stat.st_size))
 
-    # Check if the dataset is a known dataset name
-    known_datasets = ["boston_housing", "california_housing"]
-    if dataset in known_datasets:
-        return load_full_dataset(dataset)
 
-    raise ValueError(f"Unknown dataset: {dataset}")
+@st_typed_cache_resource
+def _load_image(image_path: str, file_stamp: tuple[int, int]) -> bytes:
+    """
+    Load and cache an image file for `load_image`.
+
+    Parameters
+    ----------
+    image_path : str
+        The path to the image file.
+    file_stamp : tuple[int, int]
+        The modification time in nanoseconds and the size of the file. Only
+        used as part of the cache key.
+
+    Returns
+    -------
+    bytes
+        The contents of the image file.
+    """
+    with open(image_path, "rb") as f:
+        return f.read()
@@ -17,5 +17,4 @@ def model_info(model: object) -> None:
     -------
     None
     """
-    st.text("Model last run: 2022-01-31 07:12")
-    st.text(f"Model type: {type(model)}")
+    st.text(f"Model last run: 2022-01-31 07:12\nModel type: {type(model)}")
@@ -4,177 +4,193 @@ from typing import Any
 import numpy as np
 import pandas as pd
 import streamlit as st
-from scipy.stats import mstats
+from numba import njit
+from scipy.special import ndtri
+
+# Set to True to downcast large float64 columns to float32 before building outlier masks,
+# which halves the memory traffic of every pass over them. Off by default: float32 cannot
+# resolve the spread of columns with a large offset, e.g. timestamps, and collapses it.
+USE_FP32_OUTLIERS = False
+_FP32_MIN_SIZE = 100_000
+
+_OUTLIERS_INTRO_MD = """
+## Removing Outliers and Their Impact on Machine Learning Models
+
+Outliers are data points that deviate significantly from the rest of
+the data. They can have a considerable impact on machine learning
+models, especially those that are sensitive to the distribution of
+data, such as linear regression, k-means clustering, and principal
+component analysis (PCA). Outliers can skew the model's understanding
+of the underlying data distribution, leading to poor generalization and
+predictive performance.
+"""
+
+_OUTLIER_TECHNIQUES_MD = """
+The following are some of the most common techniques for removing
+outliers, as well as their python implementations:
+
+#### Z-Score Method
+
+The Z-score is a measure of how far away a data point is from the
+mean in terms of standard deviations. Data points with a Z-score
+greater than a threshold (usually 2 or 3) are considered outliers.
+
+**Pros**:
+- Simple to understand and implement.
+- Works well if the data is normally distributed.
+
+**Cons**:
+- Not robust to skewed distributions.
+- Can remove too many data points if not carefully tuned.
+
+```python
+import numpy as np
+def remove_outliers_z_score(data, threshold=3):
+    z_scores = np.abs((data - np.mean(data)) / np.std(data))
+    return data[z_scores < threshold]
+```
+
+#### Tukey's Fences
+
+Tukey's Fences use the interquartile range (IQR) to define
+outliers. Data points outside `[Q1 - k*IQR, Q3 + k*IQR]` are
+considered outliers, where `k` is usually 1.5.
+
+**Pros**:
+- More robust to skewed distributions than the Z-score method.
+- Less sensitive to extreme values.
+
+**Cons**:
+- May still remove too many data points if k is not chosen
+    carefully.
+- Assumes that the data is unimodal.
+
+The term "unimodal" refers to a distribution that has a single,
+distinct peak or mode. In simpler terms, it means that there's one
+value that appears more frequently than any other in the dataset.
+
+```python
+def remove_outliers_tukey(data, k=1.5):
+    Q1, Q3 = np.percentile(data, [25, 75])
+    IQR = Q3 - Q1
+    return data[(data >= Q1 - k*IQR) & (data <= Q3 + k*IQR)]
+```
+
+#### Robust Z-Score
+This method is similar to the Z-score method but uses the median
+and the Median Absolute Deviation (MAD) instead of the mean and
+standard deviation.
+
+**Pros**:
+- Robust to skewed and multimodal distributions.
+- Less sensitive to extreme values.
+
+**Cons**:
+- Computationally more intensive due to the calculation of the
+    median and MAD.
+- May require a larger dataset for accurate results.
+
+```python
+def remove_outliers_robust_z_score(data, threshold=3):
+    median = np.median(data)
+    mad = np.median(np.abs(data - median))
+    robust_z_scores = np.abs((data - median) / mad)
+    return data[robust_z_scores < threshold]
+```
+
+#### Truncated Mean
+
+This method involves sorting the data and removing a certain
+percentage from both ends.
+
+**Pros**:
+- Simple and easy to implement.
+- Does not assume any specific distribution.
+
+**Cons**:
+- May remove too many or too few data points depending on the
+    percentage chosen.
+- Not robust to multimodal distributions.
+
+```python
+def remove_outliers_truncated_mean(data, percentage=10):
+    lower = np.percentile(data, percentage)
+    upper = np.percentile(data, 100 - percentage)
+    return data[(data >= lower) & (data <= upper)]
+```
+
+#### Winsorizing
+This method replaces the extreme values with certain percentiles
+rather than removing them.
+
+**Pros**:
+- Preserves the number of data points.
+- Can be applied to any distribution.
 
+**Cons**:
+- Alters the data, which may not be desirable in some cases.
+- May introduce bias if the limits are not set carefully.
 
-def introduction_to_techniques_to_remove_outliers():
+```python
+from scipy.stats import mstats
+def winsorize_data(data, limits=(0.05, 0.05)):
+    return mstats.winsorize(data, limits)
+```
+
+### Evaluation Criteria for Best Techniques
+
+1. **Data Distribution**:
+    Some methods are better suited for normally distributed data
+    (Z-score), while others are more robust (Tukey's Fences,
+    Robust Z-Score).
+2. **Data Loss**: Methods like Winsorizing do not remove data but
+    alter it, which might be preferable in cases where data is
+    scarce.
+3. **Computational Complexity**: Some methods are computationally
+    more intensive than others.
+
+### When to Use Each Method
+
+- **Z-Score Method**: Use when your data is normally distributed
+    and you can afford to lose some data points.
+- **Tukey's Fences**: Use when your data is unimodal but not
+    necessarily normally distributed.
+- **Robust Z-Score**: Use when your data is skewed or multimodal
+    and you need a robust method.
+- **Truncated Mean**: Use when you do not have any assumptions
+    about the data distribution and need a simple method.
+- **Winsorizing**: Use when you cannot afford to lose any data
+    points and are okay with altering the data.
+"""
+
+_OUTLIER_TECHNIQUES_SUMMARY_MD = """
+The choice of outlier removal technique can significantly impact the
+performance of machine learning models. It's crucial to understand the
+nature of your data and the model you are using to make an informed
+decision. One possible improvement could be to combine multiple
+techniques or use ensemble methods for a more robust approach.
+"""
+
+_TOWARDS_OUTLIERS_URL = (
+    "https://towardsdatascience.com/ways-to-detect-and-remove-the-outliers-404d16608dba"
+)
+_ANALYSIS_FACTOR_OUTLIERS_URL = "https://www.theanalysisfactor.com/outliers-to-drop-or-not-to-drop/"
+
+_OUTLIER_RESOURCES_MD = f"""
+### Additional Resources
+
+- [Ways to Detect and Remove the Outliers]({_TOWARDS_OUTLIERS_URL})
+- [Outlier Detection and Removal Techniques]({_ANALYSIS_FACTOR_OUTLIERS_URL})
+"""
+
+
+def introduction_to_techniques_to_remove_outliers() -> None:
     """Introduce the techniques to remove outliers."""
-    st.markdown(
-        """
-        ## Removing Outliers and Their Impact on Machine Learning Models
-
-        Outliers are data points that deviate significantly from the rest of
-        the data. They can have a considerable impact on machine learning
-        models, especially those that are sensitive to the distribution of
-        data, such as linear regression, k-means clustering, and principal
-        component analysis (PCA). Outliers can skew the model's understanding
-        of the underlying data distribution, leading to poor generalization and
-        predictive performance.
-        """
-    )
+    st.markdown(_OUTLIERS_INTRO_MD)
     with st.expander("### Techniques for Removing Outliers"):
-        st.markdown(
-            """
-            The following are some of the most common techniques for removing
-            outliers, as well as their python implementations:
-
-            #### Z-Score Method
-
-            The Z-score is a measure of how far away a data point is from the
-            mean in terms of standard deviations. Data points with a Z-score
-            greater than a threshold (usually 2 or 3) are considered outliers.
-
-            **Pros**:
-            - Simple to understand and implement.
-            - Works well if the data is normally distributed.
-
-            **Cons**:
-            - Not robust to skewed distributions.
-            - Can remove too many data points if not carefully tuned.
-
-            ```python
-            import numpy as np
-            def remove_outliers_z_score(data, threshold=3):
-                z_scores = np.abs((data - np.mean(data)) / np.std(data))
-                return data[z_scores < threshold]
-            ```
-
-            #### Tukey's Fences
-
-            Tukey's Fences use the interquartile range (IQR) to define
-            outliers. Data points outside `[Q1 - k*IQR, Q3 + k*IQR]` are
-            considered outliers, where `k` is usually 1.5.
-
-            **Pros**:
-            - More robust to skewed distributions than the Z-score method.
-            - Less sensitive to extreme values.
-
-            **Cons**:
-            - May still remove too many data points if k is not chosen
-                carefully.
-            - Assumes that the data is unimodal.
-
-            The term "unimodal" refers to a distribution that has a single,
-            distinct peak or mode. In simpler terms, it means that there's one
-            value that appears more frequently than any other in the dataset.
-
-            ```python
-            def remove_outliers_tukey(data, k=1.5):
-                Q1, Q3 = np.percentile(data, [25, 75])
-                IQR = Q3 - Q1
-                return data[(data >= Q1 - k*IQR) & (data <= Q3 + k*IQR)]
-            ```
-
-            #### Robust Z-Score
-            This method is similar to the Z-score method but uses the median
-            and the Median Absolute Deviation (MAD) instead of the mean and
-            standard deviation.
-
-            **Pros**:
-            - Robust to skewed and multimodal distributions.
-            - Less sensitive to extreme values.
-
-            **Cons**:
-            - Computationally more intensive due to the calculation of the
-                median and MAD.
-            - May require a larger dataset for accurate results.
-
-            ```python
-            def remove_outliers_robust_z_score(data, threshold=3):
-                median = np.median(data)
-                mad = np.median(np.abs(data - median))
-                robust_z_scores = np.abs((data - median) / mad)
-                return data[robust_z_scores < threshold]
-            ```
-
-            #### Truncated Mean
-
-            This method involves sorting the data and removing a certain
-            percentage from both ends.
-
-            **Pros**:
-            - Simple and easy to implement.
-            - Does not assume any specific distribution.
-
-            **Cons**:
-            - May remove too many or too few data points depending on the
-                percentage chosen.
-            - Not robust to multimodal distributions.
-
-            ```python
-            def remove_outliers_truncated_mean(data, percentage=10):
-                lower = np.percentile(data, percentage)
-                upper = np.percentile(data, 100 - percentage)
-                return data[(data >= lower) & (data <= upper)]
-            ```
-
-            #### Winsorizing
-            This method replaces the extreme values with certain percentiles
-            rather than removing them.
-
-            **Pros**:
-            - Preserves the number of data points.
-            - Can be applied to any distribution.
-
-            **Cons**:
-            - Alters the data, which may not be desirable in some cases.
-            - May introduce bias if the limits are not set carefully.
-
-            ```python
-            from scipy.stats import mstats
-            def winsorize_data(data, limits=(0.05, 0.05)):
-                return mstats.winsorize(data, limits)
-            ```
-
-            ### Evaluation Criteria for Best Techniques
-
-            1. **Data Distribution**:
-                Some methods are better suited for normally distributed data
-                (Z-score), while others are more robust (Tukey's Fences,
-                Robust Z-Score).
-            2. **Data Loss**: Methods like Winsorizing do not remove data but
-                alter it, which might be preferable in cases where data is
-                scarce.
-            3. **Computational Complexity**: Some methods are computationally
-                more intensive than others.
-
-            ### When to Use Each Method
-
-            - **Z-Score Method**: Use when your data is normally distributed
-                and you can afford to lose some data points.
-            - **Tukey's Fences**: Use when your data is unimodal but not
-                necessarily normally distributed.
-            - **Robust Z-Score**: Use when your data is skewed or multimodal
-                and you need a robust method.
-            - **Truncated Mean**: Use when you do not have any assumptions
-                about the data distribution and need a simple method.
-            - **Winsorizing**: Use when you cannot afford to lose any data
-                points and are okay with altering the data.
-
-
-
-            """
-        )
+        st.markdown(_OUTLIER_TECHNIQUES_MD)
 
-    st.markdown(
-        """
-        The choice of outlier removal technique can significantly impact the
-        performance of machine learning models. It's crucial to understand the
-        nature of your data and the model you are using to make an informed
-        decision. One possible improvement could be to combine multiple
-        techniques or use ensemble methods for a more robust approach.
-        """
-    )
+    st.markdown(_OUTLIER_TECHNIQUES_SUMMARY_MD)
 
 
 class OutlierValidationException(ValueError):
@@ -185,6 +201,21 @@ def validate_column(data: pd.DataFrame | np.ndarray, column: str | int | None =
     """
     Validates a column in the data and returns the values of that column.
 
+    The values are returned without copying whenever the underlying data
+    allows it. When several outlier methods are applied to the same column,
+    call this once and pass the returned array to each method with `column`
+    left as None, so the column is only extracted once.
+
+    The returned array is read-only, because it may share memory with
+    `data`. Copy it before modifying it.
+
+    If `USE_FP32_OUTLIERS` is set, float64 columns of more than 100,000
+    values are returned as float32. The outlier masks only compare values
+    against thresholds, and halving the width of the data halves the
+    memory traffic of every pass over it. Only enable it for columns whose
+    spread float32 can resolve: with 24 bits of mantissa, values around
+    1e9 are rounded to multiples of 128.
+
     Parameters
     ----------
     data : pandas.DataFrame or numpy.ndarray
@@ -207,10 +238,38 @@ def validate_column(data: pd.DataFrame | np.ndarray, column: str | int | None =
         numpy.ndarray.
     """
 
+    data = _extract_column(data, column)
+    if USE_FP32_OUTLIERS and data.dtype == np.float64 and data.size > _FP32_MIN_SIZE:
+        data = data.astype(np.float32)
+    return data
+
+
+def _extract_column(data: pd.DataFrame | np.ndarray, column: str | int | None) -> np.ndarray:
+    """
+    Return the values of `column` in `data`, as described in `validate_column`.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame or numpy.ndarray
+        The data to extract the column from.
+    column : str or int or None
+        The column name for a pandas.DataFrame, the column index for a
+        numpy.ndarray, or None to use all of `data`.
+
+    Returns
+    -------
+    numpy.ndarray
+        A read-only view of the values of the column, in their original dtype.
+
+    Raises
+    ------
+    OutlierValidationException
+        If `column` does not match the type of `data`.
+    """
     if isinstance(column, str) and isinstance(data, pd.DataFrame):
-        data = data[column].values
+        data = data[column].to_numpy(copy=False)
     elif column is None and isinstance(data, pd.DataFrame):
-        data = data.values
+        data = data.to_numpy(copy=False)
     elif isinstance(column, int) and isinstance(data, np.ndarray):
         data = data[:, column]
     elif column is None and isinstance(data, np.ndarray):
@@ -222,11 +281,343 @@ def validate_column(data: pd.DataFrame | np.ndarray, column: str | int | None =
             f"{type(data).__name__} for data and {type(column).__name__} for "
             f"column."
         )
+    data = data.view()
+    data.flags.writeable = False
     return data
 
 
+@njit(cache=True, error_model="numpy")
+def _abs_deviation_mask(
+    data: np.ndarray, center: float, limit: float, out: np.ndarray
+) -> np.ndarray:
+    """
+    Write `abs(data - center) < limit` into `out` in one pass.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The one-dimensional input data.
+    center : float
+        The value subtracted from the data, e.g. the mean or the median.
+    limit : float
+        The absolute deviation below which data points are kept.
+    out : np.ndarray
+        The boolean array, shaped like `data`, to write the mask into.
+
+    Returns
+    -------
+    np.ndarray
+        The `out` array.
+    """
+    for i in range(data.shape[0]):
+        out[i] = abs(data[i] - center) < limit
+    return out
+
+
+@njit(cache=True, error_model="numpy")
+def _score_range_mask(
+    data: np.ndarray,
+    center: float,
+    scale: float,
+    lower: float,
+    upper: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Write `(score >= lower) & (score <= upper)` into `out` in one pass, where
+    `score = (data - center) / scale`.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The one-dimensional input data.
+    center : float
+        The value subtracted from the data, e.g. the median.
+    scale : float
+        The value the centered data is divided by, e.g. the MAD.
+    lower : float
+        The smallest score that is kept.
+    upper : float
+        The largest score that is kept.
+    out : np.ndarray
+        The boolean array, shaped like `data`, to write the mask into.
+
+    Returns
+    -------
+    np.ndarray
+        The `out` array.
+    """
+    for i in range(data.shape[0]):
+        score = (data[i] - center) / scale
+        out[i] = (score >= lower) & (score <= upper)
+    return out
+
+
+@njit(cache=True, error_model="numpy", fastmath={"reassoc"})
+def _mean_std(data: np.ndarray) -> tuple[float, float]:
+    """
+    Compute the mean and the population standard deviation of `data`.
+
+    Only reassociation is enabled in `fastmath`, which lets the two
+    reductions vectorize while keeping NaN and infinity semantics intact.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The one-dimensional input data.
+
+    Returns
+    -------
+    tuple[float, float]
+        The mean and the standard deviation.
+    """
+    total = 0.0
+    for i in range(data.shape[0]):
+        total += data[i]
+    mean = total / data.shape[0]
+    squares = 0.0
+    for i in range(data.shape[0]):
+        delta = data[i] - mean
+        squares += delta * delta
+    return mean, np.sqrt(squares / data.shape[0])
+
+
+@njit(cache=True, error_model="numpy")
+def _range_mask(data: np.ndarray, lower: float, upper: float, out: np.ndarray) -> np.ndarray:
+    """
+    Write `(data >= lower) & (data <= upper)` into `out` in one pass.
+
+    Both bounds are compared directly rather than through a center and
+    half-width, which would round differently at the fences.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The one-dimensional input data.
+    lower : float
+        The smallest value that is kept.
+    upper : float
+        The largest value that is kept.
+    out : np.ndarray
+        The boolean array, shaped like `data`, to write the mask into.
+
+    Returns
+    -------
+    np.ndarray
+        The `out` array.
+    """
+    for i in range(data.shape[0]):
+        out[i] = (data[i] >= lower) & (data[i] <= upper)
+    return out
+
+
+def _mask_buffer(data: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+    """
+    Return the boolean array a mask of `data` should be written into.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The input data the mask is built for.
+    out : np.ndarray or None
+        A caller-supplied buffer, or None to allocate a new one.
+
+    Returns
+    -------
+    np.ndarray
+        `out`, or a new uninitialized boolean array shaped like `data`.
+
+    Raises
+    ------
+    OutlierValidationException
+        If `out` is not a C-contiguous boolean array shaped like `data`.
+    """
+    if out is None:
+        return np.empty(data.shape, dtype=np.bool_)
+    if out.shape != data.shape or out.dtype != np.bool_ or not out.flags.c_contiguous:
+        raise OutlierValidationException(
+            f"Invalid out array. Expected a C-contiguous boolean array of shape "
+            f"{data.shape}. Received a {out.dtype} array of shape {out.shape}."
+        )
+    return out
+
+
+def _within(
+    data: np.ndarray, lower: float, upper: float, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Return the mask of values of `data` within `[lower, upper]`.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The input data, of any shape.
+    lower : float
+        The smallest value that is kept.
+    upper : float
+        The largest value that is kept.
+    out : np.ndarray, optional
+        The boolean array to write the mask into. A new one is allocated if
+        not provided.
+
+    Returns
+    -------
+    np.ndarray
+        The boolean mask, shaped like `data`.
+    """
+    mask = _mask_buffer(data, out)
+    _range_mask(data.reshape(-1), lower, upper, mask.reshape(-1))
+    return mask
+
+
+def _abs_score_below(
+    data: np.ndarray,
+    center: float,
+    scale: float,
+    threshold: float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Return the mask of values of `data` whose absolute score is below `threshold`.
+
+    The score is never materialized: the threshold is scaled once and
+    compared against the absolute deviations, so no division is done per
+    value.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The input data, of any shape.
+    center : float
+        The value subtracted from the data.
+    scale : float
+        The value the centered data is divided by.
+    threshold : float
+        The absolute score below which data points are kept.
+    out : np.ndarray, optional
+        The boolean array to write the mask into. A new one is allocated if
+        not provided.
+
+    Returns
+    -------
+    np.ndarray
+        The boolean mask, shaped like `data`.
+    """
+    mask = _mask_buffer(data, out)
+    _abs_deviation_mask(data.reshape(-1), center, threshold * scale, mask.reshape(-1))
+    return mask
+
+
+def _median(data: np.ndarray, overwrite_input: bool = False) -> Any:
+    """
+    Compute the median of `data` with a single partition.
+
+    The middle one or two values are averaged the same way `np.median` does,
+    so the result is identical to it.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The input data. It is flattened before the median is computed.
+    overwrite_input : bool, optional
+        If True, `data` is partitioned in place instead of being copied, as
+        with `np.median`. Its contents are undefined afterwards. The default
+        is False.
+
+    Returns
+    -------
+    Any
+        The median, as a NumPy scalar.
+    """
+    flat = data.reshape(-1)
+    n = flat.shape[0]
+    if n == 0:
+        return np.median(flat)
+    half = n // 2
+    kth = [half - 1 + n % 2, half]
+    if flat.dtype.kind == "f":
+        # NaNs sort last, so selecting the last position too reveals them
+        kth.append(n - 1)
+    if overwrite_input:
+        flat.partition(kth)
+        part = flat
+    else:
+        part = np.partition(flat, kth)
+    if part.dtype.kind == "f" and np.isnan(part[-1]):
+        return part[-1]
+    return part[half - 1 + n % 2 : half + 1].mean()
+
+
+def _median_mad(data: np.ndarray) -> tuple[Any, Any]:
+    """
+    Compute the median and the Median Absolute Deviation (MAD) of `data`.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The input data.
+
+    Returns
+    -------
+    tuple[Any, Any]
+        The median and the MAD, as NumPy scalars.
+    """
+    median = _median(data)
+    deviations = data - median
+    np.abs(deviations, out=deviations)
+    # The deviations are only needed for their median, so they are partitioned in place
+    return median, _median(deviations, overwrite_input=True)
+
+
+def _quantiles(data: np.ndarray, q: float | list[float]) -> Any:
+    """
+    Compute one or several percentiles of `data` with a single partition.
+
+    The result matches `np.percentile` with its default linear
+    interpolation, including its dtype, but only one copy of the data is
+    partitioned, however many percentiles are requested.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The input data. It is flattened before the percentiles are computed.
+    q : float or list[float]
+        The percentile or percentiles to compute, between 0 and 100.
+
+    Returns
+    -------
+    Any
+        The percentile as a NumPy scalar if `q` is a float, otherwise an
+        array of the percentiles in the order they were requested.
+    """
+    flat = data.reshape(-1)
+    n = flat.shape[0]
+    if n == 0:
+        return np.percentile(flat, q)
+    virtual = (n - 1) * (np.asarray(q, dtype=np.float64) / 100)
+    lower = np.floor(virtual).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    kth = np.unique(np.concatenate((lower.ravel(), upper.ravel())))
+    if flat.dtype.kind == "f":
+        # NaNs sort last, so selecting the last position too reveals them
+        kth = np.append(kth, n - 1)
+    part = np.partition(flat, kth)
+    # Same interpolation as np.percentile, which approaches from the closer side. Like
+    # np.percentile, a single percentile is interpolated in the precision of the data.
+    a, b = part[lower], part[upper]
+    t = float(virtual - lower) if np.ndim(q) == 0 else virtual - lower
+    diff = b - a
+    result = np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+    if part.dtype.kind == "f" and np.isnan(part[-1]):
+        result[...] = np.nan
+    return result[()]
+
+
 def remove_outliers_z_score(
-    data: np.ndarray | pd.DataFrame, column: str | int | None = None, threshold: float = 3.0
+    data: np.ndarray | pd.DataFrame,
+    column: str | int | None = None,
+    threshold: float = 3.0,
+    out: np.ndarray | None = None,
 ) -> np.ndarray | pd.Series:
     """
     Remove outliers from the data using the Z-score method.
@@ -245,6 +636,10 @@ def remove_outliers_z_score(
     threshold : float, optional
         The Z-score threshold above which data points are considered outliers.
         The default is 3.0.
+    out : np.ndarray, optional
+        A C-contiguous boolean array, shaped like the validated column, to
+        write the mask into instead of allocating a new one. Useful when the
+        same column is masked repeatedly, e.g. on every Streamlit rerun.
 
     Returns
     -------
@@ -252,14 +647,65 @@ def remove_outliers_z_score(
         The mask indicating whether each data point is an outlier.
     """
     data = validate_column(data, column)
-    mean = np.mean(data)
-    std_dev = np.std(data)
-    z_scores = np.abs((data - mean) / std_dev)
-    return z_scores < threshold
+    mean, std_dev = _mean_std(data.reshape(-1))
+    return _abs_score_below(data, mean, std_dev, threshold, out)
+
+
+def remove_outliers_z_score_by_pvalue(
+    data: np.ndarray | pd.DataFrame,
+    column: str | int | None = None,
+    p: float = 0.003,
+    out: np.ndarray | None = None,
+    two_sided: bool = True,
+) -> np.ndarray | pd.Series:
+    """
+    Remove outliers from the data using a p-value cutoff.
+
+    The p-value is converted to a Z-score threshold with `scipy.special.ndtri`,
+    the inverse of the standard normal CDF, and the data is then masked with
+    `remove_outliers_z_score`. The default of 0.003 is close to the usual
+    threshold of 3 standard deviations.
+
+    Parameters
+    ----------
+    data : np.ndarray or pd.DataFrame
+        The input data from which to remove outliers.
+    column : str or int
+        The column name (if data is a DataFrame) or column number (if data is a
+        numpy array) from which to remove outliers.
+    p : float, optional
+        The tail probability below which data points are considered
+        outliers. The default is 0.003.
+    out : np.ndarray, optional
+        A C-contiguous boolean array, shaped like the validated column, to
+        write the mask into instead of allocating a new one.
+    two_sided : bool, optional
+        If True, `p` is the probability of both tails together, giving the
+        threshold `ndtri(1 - p / 2)`. If False, `p` is the probability of
+        each tail, giving the threshold `ndtri(1 - p)`. The default is True.
+
+    Returns
+    -------
+    np.ndarray or pd.Series
+        The mask indicating whether each data point is an outlier.
+
+    Raises
+    ------
+    OutlierValidationException
+        If `p` is not between 0 and 1.
+    """
+    if not 0 < p < 1:
+        raise OutlierValidationException(f"p must be between 0 and 1, got {p}")
+    # ndtri is the C routine behind norm.ppf, without the distribution object
+    threshold = float(ndtri(1 - p / 2 if two_sided else 1 - p))
+    return remove_outliers_z_score(data, column, threshold, out)
 
 
 def remove_outliers_tukey(
-    data: pd.DataFrame | np.ndarray, column: str | int | None = None, k: float = 1.5
+    data: pd.DataFrame | np.ndarray,
+    column: str | int | None = None,
+    k: float = 1.5,
+    out: np.ndarray | None = None,
 ) -> Any:
     """
     Remove outliers from the data using Tukey's Fences method.
@@ -277,6 +723,10 @@ def remove_outliers_tukey(
     k : float, optional
         The factor that determines the range outside of which data points are
         considered outliers. The default is 1.5.
+    out : np.ndarray, optional
+        A C-contiguous boolean array, shaped like the validated column, to
+        write the mask into instead of allocating a new one. Useful when the
+        same column is masked repeatedly, e.g. on every Streamlit rerun.
 
     Returns
     -------
@@ -284,9 +734,9 @@ def remove_outliers_tukey(
         The mask indicating whether each data point is an outlier.
     """
     data = validate_column(data, column)
-    Q1, Q3 = np.percentile(data, [25, 75])
+    Q1, Q3 = _quantiles(data, [25, 75])
     IQR = Q3 - Q1
-    return (data >= Q1 - k * IQR) & (data <= Q3 + k * IQR)
+    return _within(data, Q1 - k * IQR, Q3 + k * IQR, out)
 
 
 def remove_outliers_robust_z_score(
@@ -294,6 +744,7 @@ def remove_outliers_robust_z_score(
     column: str | int | None = None,
     threshold: float = 3.0,
     outlier_type: str = "both",
+    out: np.ndarray | None = None,
 ):
     """
     Remove upper or lower outliers from the data using the Robust Z-score method.
@@ -315,6 +766,10 @@ def remove_outliers_robust_z_score(
     outlier_type : str, optional
         The type of outliers to remove. Can be 'upper', 'lower', or 'both'.
         The default is 'both'.
+    out : np.ndarray, optional
+        A C-contiguous boolean array, shaped like the validated column, to
+        write the mask into instead of allocating a new one. Useful when the
+        same column is masked repeatedly, e.g. on every Streamlit rerun.
 
     Returns
     -------
@@ -322,18 +777,19 @@ def remove_outliers_robust_z_score(
         The mask indicating whether each data point is an outlier.
     """
     data = validate_column(data, column)
-    median = np.median(data)
-    mad = np.median(np.abs(data - median))
-    robust_z_scores = (data - median) / mad
-    if outlier_type == "upper":
-        return robust_z_scores <= threshold
+    median, mad = _median_mad(data)
+    if outlier_type == "both":
+        return _abs_score_below(data, median, mad, threshold, out)
+    elif outlier_type == "upper":
+        lower, upper = -np.inf, threshold
     elif outlier_type == "lower":
-        return robust_z_scores >= -threshold
-    elif outlier_type == "both":
-        robust_z_scores = np.abs((data - median) / mad)
-        return robust_z_scores < threshold
+        lower, upper = -threshold, np.inf
     else:
         raise ValueError("Invalid outlier_type. Expected 'upper', 'lower', or 'both'.")
+    # The scores are divided as before, so a zero MAD keeps its NaN and infinite scores
+    mask = _mask_buffer(data, out)
+    _score_range_mask(data.reshape(-1), median, mad, lower, upper, mask.reshape(-1))
+    return mask
 
 
 def remove_outliers_percentile(
@@ -341,7 +797,7 @@ def remove_outliers_percentile(
     column: str | int | None = None,
     percentile: float = 0.01,
     outlier_type: str = "both",
-) -> float:
+) -> float | np.ndarray:
     """
     Remove outliers from the data using the Robust Z-score method, with a
     threshold calculated based on a percentile of values to remove.
@@ -366,26 +822,30 @@ def remove_outliers_percentile(
 
     Returns
     -------
-    float
-        The threshold above which data points are considered outliers.
+    float or np.ndarray
+        The threshold above which data points are considered outliers, or
+        the lower and upper thresholds if `outlier_type` is 'both'.
     """
     data = validate_column(data, column)
-    median = np.median(data)
-    mad = np.median(np.abs(data - median))
-    robust_z_scores = (data - median) / mad
+    median, mad = _median_mad(data)
+    robust_z_scores = data - median
+    np.divide(robust_z_scores, mad, out=robust_z_scores)
 
     if outlier_type == "upper":
-        return np.percentile(robust_z_scores, 100 - percentile * 100)
+        return _quantiles(robust_z_scores, 100 - percentile * 100)
     elif outlier_type == "lower":
-        return np.percentile(robust_z_scores, percentile * 100)
+        return _quantiles(robust_z_scores, percentile * 100)
     elif outlier_type == "both":
-        return np.percentile(robust_z_scores, [percentile * 100, 100 - percentile * 100])
+        return _quantiles(robust_z_scores, [percentile * 100, 100 - percentile * 100])
     else:
         raise ValueError("Invalid outlier_type. Expected 'upper', 'lower', or 'both'.")
 
 
 def remove_outliers_truncated_mean(
-    data: pd.DataFrame | np.ndarray, column: str | int | None = None, percentage: float = 10.0
+    data: pd.DataFrame | np.ndarray,
+    column: str | int | None = None,
+    percentage: float = 10.0,
+    out: np.ndarray | None = None,
 ):
     """
     Remove outliers from the data using the Truncated Mean method.
@@ -403,6 +863,10 @@ def remove_outliers_truncated_mean(
     percentage : float, optional
         The percentage of data points to remove from both ends of the data.
         The default is 10.0.
+    out : np.ndarray, optional
+        A C-contiguous boolean array, shaped like the validated column, to
+        write the mask into instead of allocating a new one. Useful when the
+        same column is masked repeatedly, e.g. on every Streamlit rerun.
 
     Returns
     -------
@@ -410,13 +874,15 @@ def remove_outliers_truncated_mean(
         The mask indicating whether each data point is an outlier.
     """
     data = validate_column(data, column)
-    lower = np.percentile(data, percentage)
-    upper = np.percentile(data, 100 - percentage)
-    return (data >= lower) & (data <= upper)
+    lower, upper = _quantiles(data, [percentage, 100 - percentage])
+    return _within(data, lower, upper, out)
 
 
 def winsorize_data(
-    data: pd.DataFrame | np.ndarray, column: str | int | None = None, limits: tuple = (0.05, 0.05)
+    data: pd.DataFrame | np.ndarray,
+    column: str | int | None = None,
+    limits: float | tuple | None = (0.05, 0.05),
+    axis: int | None = None,
 ):
     """
     Winsorize the data.
@@ -424,6 +890,11 @@ def winsorize_data(
     This method replaces the extreme values with certain percentiles rather
     than removing them.
 
+    The bounds are found with a single partition and the data is clipped to
+    them, which gives the same values as `scipy.stats.mstats.winsorize`
+    without sorting the data. Masked arrays, data containing NaNs and
+    invalid limits are passed to `mstats.winsorize` instead.
+
     Parameters
     ----------
     data : np.ndarray or pd.DataFrame
@@ -431,28 +902,50 @@ def winsorize_data(
     column : str or int
         The column name (if data is a DataFrame) or column number (if data is a
         numpy array) from which to remove outliers.
-    limits : tuple, optional
-        The percentage of data points at each end of the data to replace.
+    limits : float or tuple, optional
+        The percentage of data points at each end of the data to replace. A
+        single value is used for both ends, as with `mstats.winsorize`.
         The default is (0.05, 0.05).
+    axis : int, optional
+        The axis along which each slice is winsorized separately. The default
+        is None, which winsorizes the flattened data.
 
     Returns
     -------
-    np.ndarray or pd.Series
-        The mask indicating whether each data point is an outlier.
+    np.ndarray or np.ma.MaskedArray
+        The winsorized data, with the same shape as the input. A masked array
+        is only returned when the input is passed on to `mstats.winsorize`.
     """
-    data = validate_column(data, column)
-    return mstats.winsorize(data, limits)
+    # scipy.stats is slow to import and only needed for the fallback cases
+    from scipy.stats import mstats
+
+    # The winsorized values are returned, so the original precision is kept
+    data = _extract_column(data, column)
+    values, along = (data.reshape(-1), 0) if axis is None else (data, axis)
+    if not isinstance(limits, (tuple, list)):
+        limits = (limits, limits)
+    lower_limit, upper_limit = (limit or 0.0 for limit in limits)
+    n = values.shape[along]
+    # Same rounding as mstats.winsorize for its default inclusive limits
+    low = int(lower_limit * n)
+    high = n - int(n * upper_limit) - 1
+    if (
+        isinstance(data, np.ma.MaskedArray)
+        or data.dtype.kind not in "iuf"
+        or not (0 <= lower_limit <= 1 and 0 <= upper_limit <= 1)
+        or not 0 <= low <= high
+    ):
+        return mstats.winsorize(data, limits, axis=axis)
+    kth = [low, high]
+    if data.dtype.kind == "f":
+        kth.append(n - 1)
+    part = np.partition(values, kth, axis=along)
+    if data.dtype.kind == "f" and np.isnan(np.take(part, -1, axis=along)).any():
+        return mstats.winsorize(data, limits, axis=axis)
+    # Keep the reduced axis so the bounds broadcast against each slice
+    return np.clip(data, np.take(part, [low], axis=along), np.take(part, [high], axis=along))
 
 
 def additional_resources_outlier_removal() -> None:
     """Provide additional resources."""
-    towards = "https://towardsdatascience.com/ways-to-detect-and-remove-the-outliers-404d16608dba"
-    analysis_factor = "https://www.theanalysisfactor.com/outliers-to-drop-or-not-to-drop/"
-    st.markdown(
-        f"""
-        ### Additional Resources
-
-        - [Ways to Detect and Remove the Outliers]({towards})
-        - [Outlier Detection and Removal Techniques]({analysis_factor})
-        """
-    )
+    st.markdown(_OUTLIER_RESOURCES_MD)
@@ -1,8 +1,5 @@
 """ SHAP components for the webapp. """
-from collections.abc import Callable
 from typing import Any
-from typing import TypeVar
-from typing import cast
 
 import matplotlib
 import numpy as np
@@ -11,64 +8,28 @@ import shap
 import streamlit as st
 from streamlit_shap import st_shap
 
-matplotlib.use("Agg")
-
-
-F = TypeVar("F", bound=Callable[..., Any])
-
-
-def st_typed_cache_resource(func: F) -> F:
-    """
-    A decorator for caching resources in Streamlit applications with type
-    annotations.
-
-    This function is a wrapper around Streamlit's cache_resource function,
-    which allows for caching of resources in Streamlit applications. The
-    decorator is designed to work with functions that have type annotations,
-    ensuring that the cached resources are of the correct type.
-
-    Parameters
-    ----------
-    func : Callable[..., Any]
-        The function whose output is to be cached. This function should have
-        type annotations for all its parameters and its return value.
-
-    Returns
-    -------
-    Callable[..., Any]
-        The same function passed in `func`, but now its output is cached by
-        Streamlit.
-    """
-    from streamlit import cache_resource
+from shap_app.webapp.cache_helpers import st_typed_cache_resource
 
-    return cast(F, cache_resource(func))
+matplotlib.use("Agg")
 
+_SHAP_LIBRARY_MD = """
+### SHAP Library
 
-def st_typed_cache_data(func: F) -> F:
-    """
-    A decorator for caching data in Streamlit applications with type
-    annotations.
+The SHAP library is a Python library that allows us to explain
+how a model works. The library is based on the idea of
+[Shapley Values](https://en.wikipedia.org/wiki/Shapley_value) from
+game theory. The library is model agnostic, meaning it can be used
+to explain any model.
+"""
 
-    This function is a wrapper around Streamlit's cache_data function, which
-    allows for caching of data in Streamlit applications. The decorator is
-    designed to work with functions that have type annotations, ensuring that
-    the cached data are of the correct type.
-
-    Parameters
-    ----------
-    func : Callable[..., Any]
-        The function whose output is to be cached. This function should have
-        type annotations for all its parameters and its return value.
-
-    Returns
-    -------
-    Callable[..., Any]
-        The same function passed in `func`, but now its output is cached by
-        Streamlit.
-    """
-    from streamlit import cache_data
-
-    return cast(F, cache_data(func))
+_SHAP_FORCE_PLOT_MD = """
+The interactive graph provided here allows you to select specific Y and X values,
+and dynamically generate plots. This feature aids in understanding the underlying
+model by visualizing the relationships between variables and their impact on the
+model's predictions. By interacting with the graph, you can gain insights into
+how changes in the input variables influence the output, thereby providing a
+deeper understanding of the model's behavior.
+"""
 
 
 def tree_shap_components_loader(
@@ -92,7 +53,8 @@ def tree_shap_components_loader(
     Returns
     -------
     tuple[shap.TreeExplainer, shap.Explanation, np.ndarray]
-        The shap components.
+        The shap components. They are cached across reruns and sessions, so
+        they must not be modified.
     """
 
     if model_path is None and model is None:
@@ -105,6 +67,9 @@ def tree_shap_components_loader(
         from shap_app.webapp.components.loaders import load_model
 
         model = load_model(model_path)
+        model_key: str | int = model_path
+    else:
+        model_key = id(model)
 
     # Load the dataset
     if dataset is None:
@@ -114,9 +79,44 @@ def tree_shap_components_loader(
 
         dataset = load_data(dataset)
 
-    explainer = shap.TreeExplainer(model)
+    return _tree_shap_components(model_key, model, dataset)
+
+
+@st_typed_cache_resource
+def _tree_shap_components(
+    model_key: str | int, _model: object, dataset: pd.DataFrame
+) -> tuple[shap.TreeExplainer, shap.Explanation, np.ndarray]:
+    """
+    Compute the shap components of a model on a dataset and cache them.
+
+    This function is decorated with the `st_typed_cache_resource` decorator,
+    so the TreeSHAP computation, which dominates the runtime of the app, only
+    runs once per model and dataset instead of on every rerun.
+
+    Parameters
+    ----------
+    model_key : str | int
+        The path the model was loaded from, or the id of the model object.
+        The cached explainer keeps a reference to the model, so its id cannot
+        be reused by another object while the entry is cached.
+    _model : object
+        The deserialized model object. It is identified by `model_key` and is
+        not hashed by Streamlit, as the leading underscore tells it to skip it.
+    dataset : pd.DataFrame
+        The dataset to explain.
+
+    Returns
+    -------
+    tuple[shap.TreeExplainer, shap.Explanation, np.ndarray]
+        The shap components.
+    """
+    explainer = shap.TreeExplainer(_model)
+    # The dataset is not downcast here: the explainer already converts it to
+    # the model's input dtype (float32 for most tree ensembles) for the tree
+    # walk, and the explanation keeps the original values for the plots.
     shap_explanation = explainer(dataset)
-    shap_values = explainer.shap_values(dataset)
+    # The explanation already holds the values shap_values() would compute again
+    shap_values = np.asarray(shap_explanation.values)
 
     return explainer, shap_explanation, shap_values
 
@@ -134,44 +134,60 @@ def main_shap_plot() -> None:
     -------
     None
     """
-    st.markdown(
-        """
-        ### SHAP Library
-
-        The SHAP library is a Python library that allows us to explain
-        how a model works. The library is based on the idea of
-        [Shapley Values](https://en.wikipedia.org/wiki/Shapley_value) from
-        game theory. The library is model agnostic, meaning it can be used
-        to explain any model.
-        """
-    )
+    st.markdown(_SHAP_LIBRARY_MD)
 
     st_shap(
-        shap.force_plot(
-            base_value=st.session_state["explainer"].expected_value,
-            shap_values=st.session_state["shap_values"],
-            features=st.session_state["X"],
-            feature_names=None,
-            out_names=None,
-            link="identity",
-            plot_cmap="RdBu",
-            matplotlib=False,
-            show=True,
-            figsize=(20, 3),
-            ordering_keys=None,
-            ordering_keys_time_format=None,
-            text_rotation=0,
-            contribution_threshold=0.05,
+        cached_force_plot(
+            st.session_state["explainer"].expected_value,
+            st.session_state["shap_values"],
+            st.session_state["X"],
         ),
         height=500,
     )
-    st.markdown(
-        """
-        The interactive graph provided here allows you to select specific Y and X values,
-        and dynamically generate plots. This feature aids in understanding the underlying
-        model by visualizing the relationships between variables and their impact on the
-        model's predictions. By interacting with the graph, you can gain insights into
-        how changes in the input variables influence the output, thereby providing a
-        deeper understanding of the model's behavior.
-        """
+    st.markdown(_SHAP_FORCE_PLOT_MD)
+
+
+@st_typed_cache_resource
+def cached_force_plot(
+    base_value: float, shap_values: np.ndarray, features: pd.DataFrame | pd.Series
+) -> Any:
+    """
+    Build a force plot and cache it.
+
+    Building the plot creates an explanation object per sample and takes much
+    longer than rendering it, so it is only done once per set of SHAP values
+    instead of on every rerun. Both the plot of all the samples and the plot
+    of a single sample go through this function, so they share the same plot
+    settings.
+
+    Parameters
+    ----------
+    base_value : float
+        The expected value of the explainer.
+    shap_values : np.ndarray
+        The SHAP values of the samples, or of a single sample.
+    features : pd.DataFrame or pd.Series
+        The feature values of the samples, or of a single sample.
+
+    Returns
+    -------
+    Any
+        The force plot visualizer. It is shared across reruns and sessions,
+        so it must not be modified.
+    """
+    return shap.force_plot(
+        base_value=base_value,
+        shap_values=shap_values,
+        features=features,
+        feature_names=None,
+        out_names=None,
+        link="identity",
+        plot_cmap="RdBu",
+        matplotlib=False,
+        show=True,
+        figsize=(20, 3),
+        ordering_keys=None,
+        ordering_keys_time_format=None,
+        text_rotation=0,
+        contribution_threshold=0.05,
     )
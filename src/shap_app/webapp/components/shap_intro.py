@@ -2,6 +2,7 @@
 
 import streamlit as st
 
+from shap_app.webapp.components.loaders import load_image
 from shap_app.webapp.images import render_svg
 
 
@@ -43,11 +44,8 @@ def main_shap_description() -> None:
             """
         )
     with shap_image:
-        with open("assets/shap_header.svg") as f:
-            lines = f.readlines()
-            line_string = "".join(lines)
-
-        render_svg(line_string)
+        # The SVG is read once and then served from the image cache
+        render_svg(load_image("assets/shap_header.svg").decode("utf-8"))
         st.markdown("")
         st.markdown(
             "SHAP Header Image from [SHAP Repository](https://github.com/slundberg/shap#readme)"
@@ -105,10 +103,7 @@ def main_shap_description() -> None:
                this is the marginal contribution of $F$.
             6. Shapley value = the average of all the values calculated in step 5
                (i.e., the average of $F$'s marginal contributions)
-            """
-        )
-        st.markdown(
-            """
+
             From
             [Shapley Values Intro](https://www.h2o.ai/blog/shapley-values-a-gentle-introduction/)
             by Adam Murphy at H2O.ai
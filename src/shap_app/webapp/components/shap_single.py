@@ -1,4 +1,6 @@
 """ SHAP Single Component """
+import io
+
 import matplotlib
 import numpy as np
 import pandas as pd
@@ -7,10 +9,16 @@ import streamlit as st
 from matplotlib import pyplot as plt
 from streamlit_shap import st_shap
 
+from shap_app.webapp.cache_helpers import st_typed_cache_data
+from shap_app.webapp.cache_helpers import st_typed_cache_resource
 from shap_app.webapp.chart_helpers import rerun_on_attribute_error
+from shap_app.webapp.components.shap import cached_force_plot
 
 matplotlib.use("Agg")
 
+# Waterfall plot PNGs kept in memory, shared by all sessions
+_WATERFALL_CACHE_ENTRIES = 128
+
 
 def get_single_explanation(
     individual_shap_values: np.ndarray,
@@ -49,33 +57,72 @@ def get_single_explanation(
         is "boston_housing", it also includes a column that provides a text
         explanation of the SHAP values on the median price.
     """
-    df = pd.DataFrame(individual_shap_values, index=dataset.columns, columns=["SHAP Value"])
-    df["Absolute_Values"] = df["SHAP Value"].abs()
-    df.sort_values(by="Absolute_Values", ascending=False, inplace=True)
-
-    if data_source == "boston_housing":
-
-        def apply_text_explanation(shap_value: float) -> str:
-            """Apply text explanation to shap value."""
-            shap_value = shap_value * 1000
-            if shap_value > 0:
-                return (
-                    f" has a positive impact, and "
-                    f"increases the predicted value by $ {shap_value:.2f}"
-                )
-            else:
-                return (
-                    f" has a negative impact, and "
-                    f"decreases the predicted value by -$ {abs(shap_value):.2f}"
-                )
-
-        df["SHAP Value Impact of the Median Price"] = df.index + df["SHAP Value"].apply(
-            apply_text_explanation
-        )
-    else:
+    return _single_explanation(individual_shap_values, tuple(dataset.columns), data_source)
+
+
+@st_typed_cache_data
+def _single_explanation(
+    individual_shap_values: np.ndarray,
+    feature_names: tuple[str, ...],
+    data_source: str | None,
+) -> pd.DataFrame:
+    """
+    Build the explanation table of a single observation and cache it.
+
+    Only the SHAP values of the observation and the feature names are hashed,
+    so moving the slider back to an observation that was already inspected
+    skips building, sorting and formatting the table again.
+
+    Parameters
+    ----------
+    individual_shap_values : np.ndarray
+        The SHAP values for a single observation.
+    feature_names : tuple[str, ...]
+        The names of the features, in the order of the SHAP values.
+    data_source : str | None
+        The data source used for the SHAP plot.
+
+    Returns
+    -------
+    pd.DataFrame
+        The explanation table described in `get_single_explanation`.
+    """
+    if data_source != "boston_housing":
         raise ValueError(f"Unknown data source: {data_source}")
 
-    return df
+    # Sort with NumPy and build the frame once, in the same order as
+    # sort_values(ascending=False): reversed quicksort for ties, NaNs last
+    absolute_values = np.abs(individual_shap_values)
+    positions = np.arange(absolute_values.size)
+    is_nan = np.isnan(absolute_values)
+    valid = positions[~is_nan][::-1]
+    order = np.concatenate(
+        [valid[absolute_values[valid].argsort(kind="quicksort")][::-1], positions[is_nan]]
+    )
+    shap_values = individual_shap_values[order]
+    sorted_names = [feature_names[i] for i in order]
+
+    # Format plain floats in one pass instead of a Series.apply callback per row,
+    # scaling in float64 as pandas did so float32 values print the same digits
+    text = [
+        (
+            f"{name} has a positive impact, and increases the predicted value by $ {impact:.2f}"
+            if impact > 0
+            else f"{name} has a negative impact, and decreases the predicted value by -$ "
+            f"{abs(impact):.2f}"
+        )
+        for name, impact in zip(
+            sorted_names, (np.asarray(shap_values, dtype=np.float64) * 1000).tolist()
+        )
+    ]
+    return pd.DataFrame(
+        {
+            "SHAP Value": shap_values,
+            "Absolute_Values": absolute_values[order],
+            "SHAP Value Impact of the Median Price": text,
+        },
+        index=pd.Index(sorted_names),
+    )
 
 
 def individual_tree_shap_plots(
@@ -136,24 +183,16 @@ def individual_tree_shap_plots(
         help="Slide to select number of observations to visually inspect",
     )
 
+    # Basic indexing gives a view of the row, shared by both consumers below
+    row_shap_values = shap_values[slider_value]
+
     # forced_plot = plt.gcf()
 
     st_shap(
-        shap.force_plot(
-            base_value=explainer.expected_value,
-            shap_values=shap_values[slider_value, :],
-            features=dataset.iloc[slider_value, :],
-            feature_names=None,
-            out_names=None,
-            link="identity",
-            plot_cmap="RdBu",
-            matplotlib=False,
-            show=True,
-            figsize=(20, 3),
-            ordering_keys=None,
-            ordering_keys_time_format=None,
-            text_rotation=0,
-            contribution_threshold=0.05,
+        cached_force_plot(
+            explainer.expected_value,
+            row_shap_values,
+            dataset.iloc[slider_value, :],
         )
     )
 
@@ -183,7 +222,7 @@ def individual_tree_shap_plots(
             "SHAP contribution. "
         )
         df = get_single_explanation(
-            individual_shap_values=shap_values[slider_value, :],
+            individual_shap_values=row_shap_values,
             dataset=dataset,
             data_source=data_source,
         )
@@ -197,8 +236,7 @@ def individual_tree_shap_plots(
         # Generate a markdown string with list items for each element in the list
         markdown_string = "\n".join([f"- {item}" for item in data_list])
         # Display the generated markdown string
-        st.markdown("**SHAP Value Impact of the Median Price**")
-        st.markdown(markdown_string)
+        st.markdown(f"**SHAP Value Impact of the Median Price**\n\n{markdown_string}")
 
 
 def plot_waterfall(shap_explanation: shap.Explanation, slider_value: int) -> None:
@@ -227,19 +265,65 @@ def plot_waterfall(shap_explanation: shap.Explanation, slider_value: int) -> Non
     -------
     None
     """
-    # Generate the SHAP plot as HTML
-    fig, axs = plt.subplots()
-    shap.waterfall_plot(
-        shap_values=shap_explanation[slider_value, :],
-        max_display=30,
-        show=False,
+    row_explanation = shap_explanation[slider_value, :]
+    waterfall_png = _waterfall_png(
+        row_explanation,
+        row_explanation.values,
+        row_explanation.base_values,
+        row_explanation.data,
+        tuple(row_explanation.feature_names),
     )
-    # Display the matplotlib figure in Streamlit
-    waterfall_fig = plt.gcf()
-    if waterfall_fig is not None:
-        st.pyplot(waterfall_fig, clear_figure=True)
+    st.image(waterfall_png, width="stretch")
 
     st.markdown(
         "Where E[f(x)] is the Expected Value of the model output for the "
         "given input (i.e., f(x))."
     )
+
+
+@st_typed_cache_resource(max_entries=_WATERFALL_CACHE_ENTRIES)
+def _waterfall_png(
+    _row_explanation: shap.Explanation,
+    values: np.ndarray,
+    base_value: float,
+    data: np.ndarray,
+    feature_names: tuple[str, ...],
+) -> bytes:
+    """
+    Render the waterfall plot of a single observation to PNG and cache it.
+
+    Explanation objects cannot be hashed by Streamlit, so the row is passed
+    unhashed and identified by its SHAP values, base value, feature values
+    and feature names. The figure is saved with the same settings
+    `st.pyplot` uses. The immutable PNG bytes are shared between sessions,
+    and only the most recently used images are kept.
+
+    Parameters
+    ----------
+    _row_explanation : shap.Explanation
+        The SHAP explanation of the observation to plot.
+    values : np.ndarray
+        The SHAP values of the observation.
+    base_value : float
+        The base value of the explanation.
+    data : np.ndarray
+        The feature values of the observation.
+    feature_names : tuple[str, ...]
+        The names of the features, which label the bars of the plot.
+
+    Returns
+    -------
+    bytes
+        The waterfall plot as a PNG image.
+    """
+    plt.subplots()
+    shap.waterfall_plot(
+        shap_values=_row_explanation,
+        max_display=30,
+        show=False,
+    )
+    waterfall_fig = plt.gcf()
+    buffer = io.BytesIO()
+    waterfall_fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    plt.close(waterfall_fig)
+    return buffer.getvalue()
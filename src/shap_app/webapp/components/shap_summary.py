@@ -1,4 +1,5 @@
 import os
+import warnings
 
 import matplotlib
 import numpy as np
@@ -6,14 +7,22 @@ import pandas as pd
 import shap
 import streamlit as st
 from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+from shap_app.webapp.chart_helpers import save_figure
+from shap_app.webapp.components.loaders import load_image
 
 matplotlib.use("Agg")
 
+# Samples drawn in a summary or dependence plot before the rows are subsampled
+_MAX_PLOT_SAMPLES = 20_000
+
 SUMMARY_PLOTS = {
     "Dot Plot": "dot",
     "Layered Violin Plot": "layered_violin",
     "Violin Plot": "violin",
 }
+_SUMMARY_PLOT_LABELS = tuple(SUMMARY_PLOTS)
 
 
 def shap_feature_summary(dataset: pd.DataFrame, shap_values: np.ndarray) -> None:
@@ -51,9 +60,9 @@ def shap_feature_summary(dataset: pd.DataFrame, shap_values: np.ndarray) -> None
         ". By doing this for all features, we see which features drive the "
         "model’s prediction a lot, and which only effect the prediction a "
         "little. Note that when points don’t fit together on the line they "
-        "pile up vertically to show density."
+        "pile up vertically to show density.\n\n"
+        "### SHAP Feature Impact"
     )
-    st.markdown("### SHAP Feature Impact")
 
     summary_plot, dependence_plot = st.columns(2)
 
@@ -105,7 +114,7 @@ def _generate_shap_summary_plot(dataset: pd.DataFrame, shap_values: np.ndarray)
             "Select the type of summary plot to display. Click on the "
             "figure for an enlarged view."
         ),
-        SUMMARY_PLOTS.keys(),
+        _SUMMARY_PLOT_LABELS,
         index=0,
         horizontal=True,
         key="summary_radio",
@@ -150,22 +159,24 @@ def generate_shap_summary_plot(
     -------
     None
     """
-    image_file = f"assets/{base_fig_name}_{SUMMARY_PLOTS[button]}.png"
+    plot_type = SUMMARY_PLOTS[button]
+    image_file = f"assets/{base_fig_name}_{plot_type}.png"
 
     if os.path.exists(image_file):
         st.image(
-            image_file,
+            load_image(image_file),
             caption=f"{button} SHAP Summary Plot",
             use_column_width=True,
         )
 
     else:
         # Generate the SHAP summary plot
-        shap.summary_plot(shap_values, dataset, plot_type=SUMMARY_PLOTS[button], show=False)
+        shap_values, dataset = _subsample_rows(shap_values, dataset)
+        shap.summary_plot(shap_values, dataset, plot_type=plot_type, show=False)
 
         # Get the current matplotlib figure
         summary_plot_fig = plt.gcf()
-        summary_plot_fig.savefig(image_file)
+        save_figure(summary_plot_fig, image_file)
         # Display the matplotlib figure in Streamlit
         st.pyplot(summary_plot_fig, clear_figure=True)
 
@@ -223,20 +234,61 @@ def generate_shap_dependence_plot(
 
     if os.path.exists(image_file):
         st.image(
-            image_file,
+            load_image(image_file),
             caption=f"SHAP dependence plot for {feature}, colored by an interaction feature",
             use_column_width=True,
         )
 
     else:
-        # Create a new matplotlib figure
-        fig, ax = plt.subplots()
-
-        # Generate the SHAP dependence plot
-        shap.dependence_plot(feature, shap_values, dataset, show=False, ax=ax)
-
-        # Get the current matplotlib figure
-        shap_dependence_plot = plt.gcf()
-        shap_dependence_plot.savefig(image_file)
+        shap_values, dataset = _subsample_rows(shap_values, dataset)
+        # A figure not managed by pyplot, so plots drawn on the current pyplot
+        # figure by other sessions cannot resize or draw over it
+        shap_dependence_plot = Figure()
+        ax = shap_dependence_plot.add_subplot()
+
+        # Generate the SHAP dependence plot. shap adds its colorbar through
+        # plt.colorbar, which warns when the axes belong to a figure other
+        # than the current pyplot figure
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", message="Adding colorbar to a different Figure", category=UserWarning
+            )
+            shap.dependence_plot(feature, shap_values, dataset, show=False, ax=ax)
+
+        save_figure(shap_dependence_plot, image_file)
         # Display the matplotlib figure in Streamlit
         st.pyplot(shap_dependence_plot, clear_figure=True)
+
+
+def _subsample_rows(
+    shap_values: np.ndarray, dataset: pd.DataFrame, max_samples: int = _MAX_PLOT_SAMPLES
+) -> tuple[np.ndarray, pd.DataFrame]:
+    """
+    Subsample the rows of the SHAP values and dataset for plotting.
+
+    Scatter plots with one marker per sample and feature get slow to draw for
+    large datasets, while the density they show is kept by a random sample.
+    The rows are drawn with a fixed seed, so the same plot is produced on
+    every run, and in their original order.
+
+    Parameters
+    ----------
+    shap_values : np.ndarray
+        The SHAP values, with a row per sample.
+    dataset : pd.DataFrame
+        The feature values, with a row per sample.
+    max_samples : int, optional
+        The number of rows above which the data is subsampled. Default is
+        `_MAX_PLOT_SAMPLES`.
+
+    Returns
+    -------
+    tuple[np.ndarray, pd.DataFrame]
+        The SHAP values and dataset, unchanged if they have at most
+        `max_samples` rows.
+    """
+    n_samples = shap_values.shape[0]
+    if n_samples <= max_samples:
+        return shap_values, dataset
+    rows = np.sort(np.random.default_rng(0).choice(n_samples, max_samples, replace=False))
+    return shap_values[rows], dataset.iloc[rows]
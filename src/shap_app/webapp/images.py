@@ -1,4 +1,5 @@
 import base64
+from functools import lru_cache
 
 import streamlit as st
 
@@ -25,6 +26,26 @@ def render_svg(svg: str) -> None:
     Borrowed From:
     https://gist.github.com/treuille/8b9cbfec270f7cda44c5fc398361b3b1
     """
+    st.write(_svg_html(svg), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=16)
+def _svg_html(svg: str) -> str:
+    """
+    Build the HTML image tag embedding the given SVG string as base64.
+
+    The tag is memoized, so an SVG is encoded once rather than on every
+    rerun of the page rendering it.
+
+    Parameters
+    ----------
+    svg : str
+        The SVG string to embed.
+
+    Returns
+    -------
+    str
+        The HTML image tag with the SVG as a base64 data URL.
+    """
     b64 = base64.b64encode(svg.encode("utf-8")).decode("utf-8")
-    html = f'<img src="data:image/svg+xml;base64,{b64}"/>'
-    st.write(html, unsafe_allow_html=True)
+    return f'<img src="data:image/svg+xml;base64,{b64}"/>'
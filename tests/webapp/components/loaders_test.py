@@ -6,6 +6,18 @@ from shap_app.webapp.components.loaders import load_data
 from shap_app.webapp.components.loaders import load_model
 
 
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "a": [1.5, 2.5, 3.5],
+            "b": ["x", "y", "x"],
+            "c": [1, 2, 3],
+            "d": [0.1, 0.2, 0.3],
+        }
+    )
+
+
 # Test cases for load_model
 @pytest.mark.parametrize(
     "model_path, expected_type",
@@ -42,3 +54,75 @@ def test_load_data(dataset, expected_type):
 def test_load_data__value_error():
     with pytest.raises(ValueError):
         load_data("non_existent_dataset")
+
+
+@pytest.mark.parametrize("dataset", ["missing.csv", "."])
+def test_load_data__value_error_not_a_file(dataset):
+    with pytest.raises(ValueError, match="Unknown dataset"):
+        load_data(dataset)
+
+
+def test_load_data__csv_round_trip(tmp_path, frame):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+
+    pd.testing.assert_frame_equal(load_data(str(path)), frame)
+
+
+def test_load_data__rewritten_file_invalidates_cache(tmp_path, frame):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    assert len(load_data(str(path))) == len(frame)
+
+    # The longer file changes the size in the (st_mtime_ns, st_size) stamp
+    pd.concat([frame, frame]).to_csv(path, index=False)
+    assert len(load_data(str(path))) == 2 * len(frame)
+
+
+def test_load_data__parquet(tmp_path, frame):
+    csv_path = tmp_path / "data.csv"
+    parquet_path = tmp_path / "data.parquet"
+    frame.to_csv(csv_path, index=False)
+    frame.to_parquet(parquet_path, index=False)
+
+    pd.testing.assert_frame_equal(load_data(str(parquet_path)), load_data(str(csv_path)))
+
+
+# Test cases for load_data with dtype and usecols
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_load_data__dtype_usecols(tmp_path, frame, suffix):
+    path = tmp_path / f"data{suffix}"
+    if suffix == ".csv":
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_parquet(path, index=False)
+
+    data = load_data(
+        str(path),
+        dtype={"a": "float32", "b": "category", "c": pd.Int64Dtype(), "d": "float32"},
+        usecols=["a", "b", "c"],
+    )
+
+    assert list(data.columns) == ["a", "b", "c"]
+    assert data["a"].dtype == "float32"
+    assert isinstance(data["b"].dtype, pd.CategoricalDtype)
+    assert data["c"].dtype == pd.Int64Dtype()
+    assert data["b"].tolist() == ["x", "y", "x"]
+    assert data["c"].tolist() == [1, 2, 3]
+
+
+def test_load_data__csv_matches_pandas_parsing(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "date,label,value\n"
+        "2024-01-02,NA,1.5\n"
+        "2024-02-03,n/a,NA\n"
+        "2024-03-04,x,\n"
+    )
+
+    data = load_data(str(path))
+
+    pd.testing.assert_frame_equal(data, pd.read_csv(path))
+    assert data["date"].tolist() == ["2024-01-02", "2024-02-03", "2024-03-04"]
+    assert data["label"].isna().tolist() == [True, True, False]
+    assert data["value"].isna().tolist() == [False, True, True]
@@ -0,0 +1,169 @@
+import numpy as np
+import pytest
+from scipy.special import ndtri
+from scipy.stats import mstats
+
+from shap_app.webapp.components import outliers
+from shap_app.webapp.components.outliers import OutlierValidationException
+from shap_app.webapp.components.outliers import _median
+from shap_app.webapp.components.outliers import _median_mad
+from shap_app.webapp.components.outliers import _quantiles
+from shap_app.webapp.components.outliers import remove_outliers_percentile
+from shap_app.webapp.components.outliers import remove_outliers_robust_z_score
+from shap_app.webapp.components.outliers import remove_outliers_tukey
+from shap_app.webapp.components.outliers import remove_outliers_z_score
+from shap_app.webapp.components.outliers import remove_outliers_z_score_by_pvalue
+from shap_app.webapp.components.outliers import validate_column
+from shap_app.webapp.components.outliers import winsorize_data
+
+
+def _sample(n, dtype, with_nan=False):
+    data = np.random.default_rng(n).standard_normal(n).astype(dtype)
+    if with_nan:
+        data[n // 3] = np.nan
+    return data
+
+
+# Test cases for the partition-based median and percentiles
+@pytest.mark.parametrize("n", [1, 2, 7, 8, 101, 1000])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_quantiles_match_numpy(n, dtype, with_nan):
+    data = _sample(n, dtype, with_nan)
+    for q in [25, 50, 75, 0, 100, 12.5, [25, 75], [1, 50, 99]]:
+        expected = np.percentile(data, q, method="linear")
+        result = _quantiles(data, q)
+        np.testing.assert_array_equal(result, expected)
+        assert np.asarray(result).dtype == np.asarray(expected).dtype
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 8, 101, 1000])
+@pytest.mark.parametrize(
+    "dtype, with_nan",
+    [
+        (np.float64, False),
+        (np.float64, True),
+        (np.float32, False),
+        (np.float32, True),
+        (np.int64, False),
+    ],
+)
+def test_median_matches_numpy(n, dtype, with_nan):
+    data = _sample(n, np.float64, with_nan)
+    data = (data * 100).astype(dtype)
+    expected = np.median(data)
+    result = _median(data)
+    np.testing.assert_array_equal(result, expected)
+    assert result.dtype == expected.dtype
+
+    median, mad = _median_mad(data)
+    np.testing.assert_array_equal(median, expected)
+    np.testing.assert_array_equal(mad, np.median(np.abs(data - np.median(data))))
+
+
+@pytest.mark.parametrize("n", [100_001, 100_002])
+def test_quantiles_match_numpy_after_fp32_downcast(monkeypatch, n):
+    monkeypatch.setattr(outliers, "USE_FP32_OUTLIERS", True)
+    data = validate_column(_sample(n, np.float64))
+    assert data.dtype == np.float32
+
+    np.testing.assert_array_equal(
+        _quantiles(data, [25, 75]), np.percentile(data, [25, 75], method="linear")
+    )
+    np.testing.assert_array_equal(_median(data), np.median(data))
+
+
+def test_validate_column_keeps_float64_without_fp32(monkeypatch):
+    monkeypatch.setattr(outliers, "USE_FP32_OUTLIERS", False)
+    assert validate_column(_sample(100_001, np.float64)).dtype == np.float64
+
+
+def test_outliers_keep_float64_precision_with_large_offset():
+    # float32 rounds values around 1.7e9 to multiples of 128, which exceeds their spread
+    data = 1.7e9 + 60 * _sample(200_000, np.float64)
+    assert validate_column(data).dtype == np.float64
+
+    median = np.median(data)
+    mad = np.median(np.abs(data - median))
+    np.testing.assert_array_equal(
+        remove_outliers_robust_z_score(data), np.abs((data - median) / mad) < 3
+    )
+    mean, std = data.mean(), data.std()
+    np.testing.assert_array_equal(remove_outliers_z_score(data), np.abs((data - mean) / std) < 3)
+    q1, q3 = np.percentile(data, [25, 75])
+    np.testing.assert_array_equal(
+        remove_outliers_tukey(data),
+        (data >= q1 - 1.5 * (q3 - q1)) & (data <= q3 + 1.5 * (q3 - q1)),
+    )
+
+    thresholds = remove_outliers_percentile(data)
+    assert thresholds.dtype == np.float64
+    np.testing.assert_array_equal(
+        thresholds, np.percentile((data - median) / mad, [1, 99], method="linear")
+    )
+
+
+# Test cases for remove_outliers_z_score_by_pvalue
+@pytest.mark.parametrize("p", [0.003, 0.05, 0.5])
+def test_z_score_by_pvalue_matches_z_score(p):
+    data = _sample(1000, np.float64)
+
+    np.testing.assert_array_equal(
+        remove_outliers_z_score_by_pvalue(data, p=p),
+        remove_outliers_z_score(data, threshold=ndtri(1 - p / 2)),
+    )
+    np.testing.assert_array_equal(
+        remove_outliers_z_score_by_pvalue(data, p=p, two_sided=False),
+        remove_outliers_z_score(data, threshold=ndtri(1 - p)),
+    )
+
+
+@pytest.mark.parametrize("p", [0, -0.1, 1, 1.5])
+def test_z_score_by_pvalue_invalid_p(p):
+    with pytest.raises(OutlierValidationException):
+        remove_outliers_z_score_by_pvalue(_sample(10, np.float64), p=p)
+
+
+# Test cases for winsorize_data
+@pytest.mark.parametrize(
+    "shape, axis",
+    [
+        ((1,), None),
+        ((7,), None),
+        ((100,), 0),
+        ((20, 9), None),
+        ((20, 9), 0),
+        ((20, 9), 1),
+        ((9, 20), 0),
+        ((9, 20), 1),
+    ],
+)
+@pytest.mark.parametrize("limits", [(0.05, 0.05), (0.1, 0.2), (0.0, 0.3), (0.25, None), 0.1, None])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+def test_winsorize_matches_mstats(shape, axis, limits, dtype):
+    data = (_sample(int(np.prod(shape)), np.float64).reshape(shape) * 100).astype(dtype)
+    expected = mstats.winsorize(data, limits, axis=axis)
+
+    result = winsorize_data(data, limits=limits, axis=axis)
+
+    assert not isinstance(result, np.ma.MaskedArray)
+    assert result.shape == data.shape
+    assert result.dtype == data.dtype
+    np.testing.assert_array_equal(result, np.ma.getdata(expected))
+
+
+@pytest.mark.parametrize(
+    "data, limits",
+    [
+        (np.array([1.0, np.nan, 3.0, 4.0, 100.0]), (0.2, 0.2)),
+        (np.ma.masked_array([1.0, 2.0, 3.0, 4.0, 100.0], mask=[0, 0, 1, 0, 0]), (0.2, 0.2)),
+        (np.arange(10.0), (0.6, 0.6)),
+    ],
+)
+def test_winsorize_fallback_matches_mstats(data, limits):
+    expected = mstats.winsorize(data, limits)
+
+    result = winsorize_data(data, limits=limits)
+
+    np.testing.assert_array_equal(np.ma.getdata(result), np.ma.getdata(expected))
+    np.testing.assert_array_equal(np.ma.getmaskarray(result), np.ma.getmaskarray(expected))